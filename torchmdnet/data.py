@@ -140,6 +140,7 @@ class DataModule(LightningDataModule):
             batch_size=batch_size,
             num_workers=self.hparams["num_workers"],
             pin_memory=True,
+            persistent_workers=self.hparams["num_workers"] > 0,
             shuffle=shuffle,
         )
 
@@ -416,9 +416,7 @@ class Distance(nn.Module):
         )
 
         # make sure we didn't miss any neighbors due to max_num_neighbors
-        assert not (
-            torch.unique(edge_index[0], return_counts=True)[1] > self.max_num_neighbors
-        ).any(), (
+        assert not (torch.bincount(edge_index[0]) > self.max_num_neighbors).any(), (
             "The neighbor search missed some atoms due to max_num_neighbors being too low. "
             "Please increase this parameter to include the maximum number of atoms within the cutoff."
         )